@@ -221,12 +221,19 @@ def list(directory: str, type: Optional[str], format: str):
 @click.option("--title", help="Title for the new item")
 @click.option("--req-type", help="Type of requirement (functional, security, etc.)")
 @click.option("--output", "-o", help="Output file path")
+@click.option(
+    "--directory",
+    "-d",
+    default=".",
+    help="Project directory (default output location and source of existing requirements)",
+)
 def create(
     type: str,
     id: Optional[str],
     title: Optional[str],
     req_type: Optional[str],
     output: Optional[str],
+    directory: str,
 ):
     """Create a new requirement or specification"""
 
@@ -289,7 +296,9 @@ def create(
         )
 
         if not output:
-            output = f"requirements/{id.lower().replace('-', '_')}.yaml"
+            output = str(
+                Path(directory) / "requirements" / f"{id.lower().replace('-', '_')}.yaml"
+            )
 
         parser = ProjectParser()
         output_path = Path(output)
@@ -302,8 +311,7 @@ def create(
         description = click.prompt("Enter specification description")
 
         # Load existing requirements for interactive selection
-        current_dir = Path.cwd()
-        existing_requirements = load_existing_requirements(current_dir)
+        existing_requirements = load_existing_requirements(Path(directory))
 
         click.echo(f"\nFound {len(existing_requirements)} existing requirements.")
         related_requirements = interactive_requirement_selection(existing_requirements)
@@ -327,7 +335,12 @@ def create(
         )
 
         if not output:
-            output = f"requirements/specifications/{id.lower().replace('-', '_')}.yaml"
+            output = str(
+                Path(directory)
+                / "requirements"
+                / "specifications"
+                / f"{id.lower().replace('-', '_')}.yaml"
+            )
 
         parser = ProjectParser()
         output_path = Path(output)
@@ -353,8 +366,9 @@ def export(directory: str, output: str):
     try:
         # Load requirements and specifications
         parser = ProjectParser()
-        requirements = parser.req_parser.parse_requirements_directory(project_path)
-        specifications = parser.spec_parser.parse_specifications_directory(project_path)
+        data = parser.parse_project(project_path)
+        requirements = data["requirements"]
+        specifications = data["specifications"]
 
         if not requirements and not specifications:
             click.echo(
@@ -382,9 +396,9 @@ def export(directory: str, output: str):
 
         # Summary statistics
         if requirements and specifications:
-            traced_reqs = set()
-            for spec in specifications:
-                traced_reqs.update(spec.related_requirements)
+            traced_reqs = {
+                req_id for spec in specifications for req_id in spec.related_requirements
+            }
 
             untraced_count = len(requirements) - len(traced_reqs)
             if untraced_count > 0:
@@ -425,16 +439,16 @@ def coverage(test_output_file: str, directory: str):
         for spec in specs:
             if hasattr(spec, 'unit_test') and spec.unit_test:
                 test_path = spec.unit_test
-                # Check if the test file actually exists
-                if Path(test_path).exists():
-                    spec_tests.add(test_path)
-                    if test_path not in test_to_specs:
-                        test_to_specs[test_path] = []
+                # Only stat each test file once, however many specs share it
+                if test_path in test_to_specs:
                     test_to_specs[test_path].append(spec.id)
-                else:
-                    if test_path not in invalid_files:
-                        invalid_files[test_path] = []
+                elif test_path in invalid_files:
                     invalid_files[test_path].append(spec.id)
+                elif Path(test_path).exists():
+                    spec_tests.add(test_path)
+                    test_to_specs[test_path] = [spec.id]
+                else:
+                    invalid_files[test_path] = [spec.id]
         
         if not spec_tests and not invalid_files:
             click.echo("No unit tests found in specifications")
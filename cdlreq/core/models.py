@@ -1,11 +1,45 @@
 """Data models for requirements and specifications"""
 
+import operator
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 from pathlib import Path
 
-
-@dataclass
+# dataclass(slots=True) is only available from Python 3.10
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Allowed Requirement.type values, built once rather than on every __post_init__
+_VALID_REQUIREMENT_TYPES = frozenset(
+    {
+        "functional",
+        "security",
+        "performance",
+        "usability",
+        "reliability",
+        "maintainability",
+        "portability",
+        "regulatory",
+        "safety",
+    }
+)
+
+# Fields always emitted by to_dict, read in one C-level attrgetter call
+_REQUIREMENT_FIELDS = ("id", "title", "description", "type", "acceptance_criteria")
+_get_requirement_fields = operator.attrgetter(*_REQUIREMENT_FIELDS)
+
+_SPECIFICATION_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "related_requirements",
+    "implementation_unit",
+    "unit_test",
+)
+_get_specification_fields = operator.attrgetter(*_SPECIFICATION_FIELDS)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Requirement:
     """Medical software requirement model"""
 
@@ -23,29 +57,12 @@ class Requirement:
         if not self.id.startswith("REQ-"):
             raise ValueError(f"Requirement ID must start with 'REQ-': {self.id}")
 
-        valid_types = {
-            "functional",
-            "security",
-            "performance",
-            "usability",
-            "reliability",
-            "maintainability",
-            "portability",
-            "regulatory",
-            "safety",
-        }
-        if self.type not in valid_types:
+        if self.type not in _VALID_REQUIREMENT_TYPES:
             raise ValueError(f"Invalid requirement type: {self.type}")
 
     def to_dict(self) -> dict:
         """Convert requirement to dictionary"""
-        result = {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "type": self.type,
-            "acceptance_criteria": self.acceptance_criteria,
-        }
+        result = dict(zip(_REQUIREMENT_FIELDS, _get_requirement_fields(self)))
         if self.tags:
             result["tags"] = self.tags
         if self.source:
@@ -55,7 +72,7 @@ class Requirement:
         return result
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Specification:
     """Medical software specification model"""
 
@@ -85,14 +102,7 @@ class Specification:
 
     def to_dict(self) -> dict:
         """Convert specification to dictionary"""
-        result = {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "related_requirements": self.related_requirements,
-            "implementation_unit": self.implementation_unit,
-            "unit_test": self.unit_test,
-        }
+        result = dict(zip(_SPECIFICATION_FIELDS, _get_specification_fields(self)))
         if self.design_notes:
             result["design_notes"] = self.design_notes
         if self.dependencies:
@@ -2,9 +2,9 @@
 
 import yaml
 from pathlib import Path
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Callable
 from .models import Requirement, Specification
-from .validator import RequirementValidator, SpecificationValidator
+from .validator import RequirementValidator, SpecificationValidator, _Loader
 
 
 class ParseError(Exception):
@@ -22,8 +22,9 @@ class BaseParser:
     def parse_yaml_file(self, file_path: Path) -> Dict[str, Any]:
         """Parse YAML file and return data"""
         try:
-            with open(file_path, "r") as f:
-                data = yaml.safe_load(f)
+            # Hand the raw bytes to the loader so it performs the only decode pass
+            with open(file_path, "rb") as f:
+                data = yaml.load(f, Loader=_Loader)
             if not isinstance(data, dict):
                 raise ParseError(f"YAML file must contain a dictionary: {file_path}")
             return data
@@ -32,6 +33,36 @@ class BaseParser:
         except Exception as e:
             raise ParseError(f"Error reading file {file_path}: {e}")
 
+    def parse_directory(
+        self, directory: Path, builders: Dict[str, Callable[[Dict[str, Any]], Any]]
+    ) -> Dict[str, List[Any]]:
+        """Parse every YAML file under a directory once, building items by ID prefix
+
+        builders maps an ID prefix (e.g. "REQ-") to the function that builds its
+        model. Returns the built items per prefix, in directory walk order.
+        """
+        items = {prefix: [] for prefix in builders}
+        prefixes = tuple(builders)
+        for file_path in Path(directory).glob("**/*.yaml"):
+            data = None
+            try:
+                data = self.parse_yaml_file(file_path)
+                item_id = data.get("id")
+                if isinstance(item_id, str):
+                    for prefix, build in builders.items():
+                        if item_id.startswith(prefix):
+                            # Create the object directly, skipping schema validation for parsing
+                            items[prefix].append(build(data))
+                            break
+            except ParseError as e:
+                print(f"Warning: Skipping {file_path}: {e}")
+            except Exception as e:
+                # Skip unrelated files silently, but log errors in files we build from
+                item_id = data.get("id") if isinstance(data, dict) else None
+                if isinstance(item_id, str) and item_id.startswith(prefixes):
+                    print(f"Warning: Skipping {file_path}: {e}")
+        return items
+
 
 class RequirementParser(BaseParser):
     """Parser for requirement files"""
@@ -68,28 +99,9 @@ class RequirementParser(BaseParser):
 
     def parse_requirements_directory(self, directory: Path) -> List[Requirement]:
         """Parse all requirement files in a directory"""
-        requirements = []
-        for file_path in directory.glob("**/*.yaml"):
-            data = None
-            try:
-                # Check if this is a requirement file by looking at the ID field
-                data = self.parse_yaml_file(file_path)
-                if isinstance(data, dict) and data.get("id", "").startswith("REQ-"):
-                    # Try to create requirement object directly, skipping schema validation for parsing
-                    req = self.create_requirement_from_data(data)
-                    requirements.append(req)
-            except ParseError as e:
-                print(f"Warning: Skipping {file_path}: {e}")
-            except Exception as e:
-                # Skip non-requirement files silently, but log validation errors
-                if (
-                    data
-                    and isinstance(data, dict)
-                    and data.get("id", "").startswith("REQ-")
-                ):
-                    print(f"Warning: Skipping {file_path}: {e}")
-                pass
-        return requirements
+        return self.parse_directory(
+            directory, {"REQ-": self.create_requirement_from_data}
+        )["REQ-"]
 
 
 class SpecificationParser(BaseParser):
@@ -127,28 +139,9 @@ class SpecificationParser(BaseParser):
 
     def parse_specifications_directory(self, directory: Path) -> List[Specification]:
         """Parse all specification files in a directory"""
-        specifications = []
-        for file_path in directory.glob("**/*.yaml"):
-            data = None
-            try:
-                # Check if this is a specification file by looking at the ID field
-                data = self.parse_yaml_file(file_path)
-                if isinstance(data, dict) and data.get("id", "").startswith("SPEC-"):
-                    # Try to create specification object directly, skipping schema validation for parsing
-                    spec = self.create_specification_from_data(data)
-                    specifications.append(spec)
-            except ParseError as e:
-                print(f"Warning: Skipping {file_path}: {e}")
-            except Exception as e:
-                # Skip non-specification files silently, but log validation errors
-                if (
-                    data
-                    and isinstance(data, dict)
-                    and data.get("id", "").startswith("SPEC-")
-                ):
-                    print(f"Warning: Skipping {file_path}: {e}")
-                pass
-        return specifications
+        return self.parse_directory(
+            directory, {"SPEC-": self.create_specification_from_data}
+        )["SPEC-"]
 
 
 class ProjectParser:
@@ -161,11 +154,18 @@ class ProjectParser:
     def parse_project(
         self, project_path: Path
     ) -> Dict[str, Union[List[Requirement], List[Specification]]]:
-        """Parse all requirements and specifications in a project"""
-        requirements = self.req_parser.parse_requirements_directory(project_path)
-        specifications = self.spec_parser.parse_specifications_directory(project_path)
-
-        return {"requirements": requirements, "specifications": specifications}
+        """Parse all requirements and specifications in a project
+
+        The tree is walked once and every YAML file is parsed once.
+        """
+        items = self.req_parser.parse_directory(
+            project_path,
+            {
+                "REQ-": self.req_parser.create_requirement_from_data,
+                "SPEC-": self.spec_parser.create_specification_from_data,
+            },
+        )
+        return {"requirements": items["REQ-"], "specifications": items["SPEC-"]}
 
     def save_requirement(self, requirement: Requirement, file_path: Path) -> None:
         """Save requirement to YAML file"""
@@ -1,12 +1,20 @@
 """Schema validation for requirements and specifications"""
 
+import functools
 import yaml
 import json
 from pathlib import Path
 from typing import Dict, Any, List
-from jsonschema import validate, ValidationError, Draft7Validator
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
 from .models import Requirement, Specification
 
+# Prefer the libyaml-backed loader; it is a drop-in for SafeLoader
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 class ValidationResult:
     """Result of validation operation"""
@@ -19,34 +27,38 @@ class ValidationResult:
         return self.is_valid
 
 
+@functools.lru_cache(maxsize=None)
+def _load_validator(schema_path: Path) -> Draft7Validator:
+    """Load and compile a schema once per path for the life of the process"""
+    with open(schema_path, "rb") as f:
+        schema = yaml.load(f, Loader=_Loader)
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
+
+
 class BaseValidator:
     """Base class for validators"""
 
     def __init__(self, schema_path: Path):
         self.schema_path = schema_path
-        self._schema = None
 
     @property
     def schema(self) -> Dict[str, Any]:
         """Load and cache schema"""
-        if self._schema is None:
-            with open(self.schema_path, "r") as f:
-                self._schema = yaml.safe_load(f)
-        return self._schema
+        return _load_validator(self.schema_path).schema
 
     def validate_data(self, data: Dict[str, Any]) -> ValidationResult:
         """Validate data against schema"""
-        try:
-            validate(instance=data, schema=self.schema)
+        error = best_match(_load_validator(self.schema_path).iter_errors(data))
+        if error is None:
             return ValidationResult(True)
-        except ValidationError as e:
-            return ValidationResult(False, [str(e)])
+        return ValidationResult(False, [str(error)])
 
     def validate_file(self, file_path: Path) -> ValidationResult:
         """Validate YAML file against schema"""
         try:
-            with open(file_path, "r") as f:
-                data = yaml.safe_load(f)
+            with open(file_path, "rb") as f:
+                data = yaml.load(f, Loader=_Loader)
             return self.validate_data(data)
         except Exception as e:
             return ValidationResult(False, [f"Error reading file: {str(e)}"])
@@ -89,16 +101,13 @@ class CrossReferenceValidator:
         """Validate cross-references between requirements and specifications"""
         errors = []
 
-        # Check that all referenced requirements exist
+        # Check that all referenced requirements and dependencies exist
         for spec in self.specifications.values():
             for req_id in spec.related_requirements:
                 if req_id not in self.requirements:
                     errors.append(
                         f"Specification {spec.id} references non-existent requirement {req_id}"
                     )
-
-        # Check that all specification dependencies exist
-        for spec in self.specifications.values():
             for dep_id in spec.dependencies:
                 if dep_id not in self.specifications:
                     errors.append(
@@ -119,14 +128,12 @@ class CrossReferenceValidator:
 
     def get_missing_requirement_links(self) -> List[tuple]:
         """Get list of (specification_id, missing_requirement_id) tuples for warnings"""
-        missing_links = []
-
-        for spec in self.specifications.values():
-            for req_id in spec.related_requirements:
-                if req_id not in self.requirements:
-                    missing_links.append((spec.id, req_id))
-
-        return missing_links
+        return [
+            (spec.id, req_id)
+            for spec in self.specifications.values()
+            for req_id in spec.related_requirements
+            if req_id not in self.requirements
+        ]
 
     def _find_circular_dependencies(self) -> List[List[str]]:
         """Find circular dependencies in specifications"""
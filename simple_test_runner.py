@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """
-Simple test runner for cdlreq that doesn't depend on pytest
+Simple test runner for cdlreq that runs test classes without the pytest runner
 """
 
+import functools
+import inspect
 import sys
+import tempfile
 import traceback
 from pathlib import Path
 
@@ -11,11 +14,19 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 def run_test_method(test_class, method_name):
-    """Run a single test method"""
+    """Run a single test method, returning None if it was skipped"""
     try:
         instance = test_class()
         method = getattr(instance, method_name)
-        method()
+        params = inspect.signature(method).parameters
+        if set(params) - {"tmp_path"}:
+            print(f"⏭️  {test_class.__name__}.{method_name}: needs pytest fixtures")
+            return None
+        if params:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                method(tmp_path=Path(temp_dir))
+        else:
+            method()
         print(f"✅ {test_class.__name__}.{method_name}")
         return True
     except Exception as e:
@@ -24,26 +35,39 @@ def run_test_method(test_class, method_name):
             traceback.print_exc()
         return False
 
+@functools.lru_cache(maxsize=None)
+def _test_methods(test_class):
+    """Return the sorted test method names defined directly on a class"""
+    return tuple(sorted(
+        name for name, value in vars(test_class).items()
+        if name.startswith('test_') and callable(value)
+    ))
+
 def run_test_class(test_class):
     """Run all test methods in a class"""
-    methods = [name for name in dir(test_class) if name.startswith('test_')]
+    methods = _test_methods(test_class)
     passed = 0
+    skipped = 0
     total = len(methods)
     
     print(f"\nRunning {test_class.__name__} ({total} tests):")
     print("-" * 50)
     
     for method_name in methods:
-        if run_test_method(test_class, method_name):
+        result = run_test_method(test_class, method_name)
+        if result is None:
+            skipped += 1
+        elif result:
             passed += 1
     
-    print(f"Result: {passed}/{total} passed")
-    return passed, total
+    print(f"Result: {passed}/{total} passed, {skipped} skipped")
+    return passed, total, skipped
 
 def main():
     """Main test runner"""
     total_passed = 0
     total_tests = 0
+    total_skipped = 0
     
     print("=" * 60)
     print("Running cdlreq tests (simple runner)")
@@ -68,24 +92,28 @@ def main():
         ]
         
         for test_class in test_classes:
-            passed, total = run_test_class(test_class)
+            passed, total, skipped = run_test_class(test_class)
             total_passed += passed
             total_tests += total
+            total_skipped += skipped
             
     except ImportError as e:
         print(f"Could not import tests: {e}")
         return 1
     
     print("\n" + "=" * 60)
-    print(f"FINAL RESULT: {total_passed}/{total_tests} tests passed")
+    print(f"FINAL RESULT: {total_passed}/{total_tests} tests passed, {total_skipped} skipped")
     print("=" * 60)
     
-    if total_passed == total_tests:
-        print("🎉 All tests passed!")
-        return 0
-    else:
-        print(f"💥 {total_tests - total_passed} tests failed!")
+    failed = total_tests - total_passed - total_skipped
+    if failed:
+        print(f"💥 {failed} tests failed!")
         return 1
+    if total_skipped:
+        print(f"⚠️  No failures, but {total_skipped} tests were skipped")
+    else:
+        print("🎉 All tests passed!")
+    return 0
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -1,347 +1,320 @@
 """Tests for cdlreq.cli.commands"""
 
+import pytest
+import yaml
+from click.testing import CliRunner
 try:
-    import pytest
+    from yaml import CSafeLoader as _Loader
 except ImportError:
-    # Create a dummy pytest module for environments without pytest
-    class DummyPytest:
-        @staticmethod
-        def skip(reason):
-            print(f"SKIP: {reason}")
-    pytest = DummyPytest()
+    from yaml import SafeLoader as _Loader
 
-import tempfile
-import yaml
-from pathlib import Path
+from cdlreq.cli.commands import cli
+from tests.conftest import list_files, write_yaml
 
-try:
-    from click.testing import CliRunner
-    from cdlreq.cli.commands import cli
-    CLI_AVAILABLE = True
-except ImportError as e:
-    print(f"CLI testing not available: {e}")
-    CLI_AVAILABLE = False
+# CliRunner keeps no per-invocation state, so one instance serves every test
+_RUNNER = CliRunner()
+
+# Invoke subcommands directly so each call skips the group's dispatch step
+_CMDS = {
+    name: cli.commands[name]
+    for name in ("init", "list", "coverage", "create", "export")
+}
 
 
 class TestInitCommand:
     """Test cases for init command"""
     
-    def test_init_command_default_directory(self):
-        """Test init command with default directory"""
-        if not CLI_AVAILABLE:
-            print("SKIP: CLI testing not available")
-            return
-            
-        runner = CliRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            try:
-                # Change to temp directory
-                result = runner.invoke(cli, ['init'], catch_exceptions=False, 
-                                     cwd=temp_dir)
-                
-                assert result.exit_code == 0
-                assert "Initialized cdlreq project" in result.output
-                
-                # Check if directories were created
-                temp_path = Path(temp_dir)
-                assert (temp_path / "requirements").exists()
-                assert (temp_path / "requirements" / "specifications").exists()
-                
-                # Check if example files were created
-                assert (temp_path / "requirements" / "authentication.yaml").exists()
-                assert (temp_path / "requirements" / "specifications" / "authentication.yaml").exists()
-            except Exception as e:
-                print(f"SKIP: CLI test failed due to dependencies: {e}")
+    def test_init_command_default_directory(self, tmp_path, monkeypatch):
+        """Test init command initializes the current directory by default"""
+        monkeypatch.chdir(tmp_path)
+        
+        result = _RUNNER.invoke(_CMDS["init"], [], catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        assert "Initialized cdlreq project" in result.output
+        
+        # Check directories and example files with one read per directory
+        req_files = list_files(tmp_path / "requirements")
+        spec_files = list_files(tmp_path / "requirements" / "specifications")
+        assert "authentication.yaml" in req_files
+        assert "authentication.yaml" in spec_files
     
-    def test_init_command_custom_directory(self):
+    def test_init_command_custom_directory(self, tmp_path):
         """Test init command with custom directory"""
-        runner = CliRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            custom_dir = Path(temp_dir) / "custom_project"
-            
-            result = runner.invoke(cli, ['init', '--directory', str(custom_dir)],
-                                 catch_exceptions=False)
-            
-            assert result.exit_code == 0
-            assert str(custom_dir) in result.output
-            assert custom_dir.exists()
+        custom_dir = tmp_path / "custom_project"
+        
+        result = _RUNNER.invoke(_CMDS["init"], ['--directory', str(custom_dir)],
+                             catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        assert str(custom_dir) in result.output
+        assert custom_dir.exists()
 
 
 class TestValidateCommand:
     """Test cases for validate command"""
     
-    def test_validate_command_no_files(self):
+    def test_validate_command_no_files(self, tmp_path):
         """Test validate command with no requirement files"""
-        runner = CliRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = runner.invoke(cli, ['validate', '--directory', temp_dir],
-                                 catch_exceptions=False)
-            
-            # Should handle empty directory gracefully
-            assert result.exit_code in [0, 1]  # May pass or fail depending on implementation
+        result = _RUNNER.invoke(cli, ['validate', '--directory', str(tmp_path)],
+                             catch_exceptions=False)
+        
+        # Should handle empty directory gracefully
+        assert result.exit_code in [0, 1]  # May pass or fail depending on implementation
     
-    def test_validate_command_valid_files(self):
+    def test_validate_command_valid_files(self, tmp_path):
         """Test validate command with valid requirement and specification files"""
-        runner = CliRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create requirements directory
-            req_dir = temp_path / "requirements"
-            req_dir.mkdir()
-            
-            # Create valid requirement
-            req_data = {
-                "id": "REQ-TEST-001",
-                "title": "Test Requirement",
-                "description": "A test requirement for validation",
-                "type": "functional"
-            }
-            
-            with open(req_dir / "test_req.yaml", 'w') as f:
-                yaml.dump(req_data, f)
-            
-            # Create specifications directory
-            spec_dir = req_dir / "specifications"
-            spec_dir.mkdir()
-            
-            # Create valid specification
-            spec_data = {
-                "id": "SPEC-TEST-001",
-                "title": "Test Specification",
-                "description": "A test specification for validation",
-                "related_requirements": ["REQ-TEST-001"],
-                "implementation_unit": "src/test.py",
-                "unit_test": "tests/test_test.py"
-            }
-            
-            with open(spec_dir / "test_spec.yaml", 'w') as f:
-                yaml.dump(spec_data, f)
-            
-            result = runner.invoke(cli, ['validate', '--directory', str(temp_path)],
-                                 catch_exceptions=False)
-            
-            assert result.exit_code == 0
-            assert "Validation successful" in result.output
+        # Create requirements directory
+        req_dir = tmp_path / "requirements"
+        req_dir.mkdir()
+        
+        # Create valid requirement
+        req_data = {
+            "id": "REQ-TEST-001",
+            "title": "Test Requirement",
+            "description": "A test requirement for validation",
+            "type": "functional"
+        }
+        
+        write_yaml(req_dir / "test_req.yaml", req_data)
+        
+        # Create specifications directory
+        spec_dir = req_dir / "specifications"
+        spec_dir.mkdir()
+        
+        # Create valid specification
+        spec_data = {
+            "id": "SPEC-TEST-001",
+            "title": "Test Specification",
+            "description": "A test specification for validation",
+            "related_requirements": ["REQ-TEST-001"],
+            "implementation_unit": "src/test.py",
+            "unit_test": "tests/test_test.py"
+        }
+        
+        write_yaml(spec_dir / "test_spec.yaml", spec_data)
+        
+        result = _RUNNER.invoke(cli, ['validate', '--directory', str(tmp_path)],
+                             catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        assert "Validation successful" in result.output
 
 
 class TestListCommand:
     """Test cases for list command"""
     
-    def test_list_command_empty_directory(self):
+    def test_list_command_empty_directory(self, tmp_path):
         """Test list command with empty directory"""
-        runner = CliRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = runner.invoke(cli, ['list', '--directory', temp_dir],
-                                 catch_exceptions=False)
-            
-            # Should handle empty directory gracefully
-            assert result.exit_code in [0, 1]
+        result = _RUNNER.invoke(_CMDS["list"], ['--directory', str(tmp_path)],
+                             catch_exceptions=False)
+        
+        # Should handle empty directory gracefully
+        assert result.exit_code in [0, 1]
     
-    def test_list_command_with_files(self):
+    def test_list_command_with_files(self, tmp_path):
         """Test list command with requirement and specification files"""
-        runner = CliRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create test files using the fixtures
-            req_dir = temp_path / "requirements"
-            req_dir.mkdir()
-            
-            req_data = {
-                "id": "REQ-LIST-001",
-                "title": "List Test Requirement",
-                "description": "A requirement for list testing",
-                "type": "functional"
-            }
-            
-            with open(req_dir / "list_req.yaml", 'w') as f:
-                yaml.dump(req_data, f)
-            
-            result = runner.invoke(cli, ['list', '--directory', str(temp_path)],
-                                 catch_exceptions=False)
-            
-            assert result.exit_code == 0
-            # Should contain the requirement ID
-            assert "REQ-LIST-001" in result.output or "Requirements:" in result.output
+        # Create test files using the fixtures
+        req_dir = tmp_path / "requirements"
+        req_dir.mkdir()
+        
+        req_data = {
+            "id": "REQ-LIST-001",
+            "title": "List Test Requirement",
+            "description": "A requirement for list testing",
+            "type": "functional"
+        }
+        
+        write_yaml(req_dir / "list_req.yaml", req_data)
+        
+        result = _RUNNER.invoke(_CMDS["list"], ['--directory', str(tmp_path)],
+                             catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        # Should contain the requirement ID
+        assert "REQ-LIST-001" in result.output or "Requirements:" in result.output
 
 
 class TestCoverageCommand:
     """Test cases for coverage command"""
     
-    def test_coverage_command_basic(self):
+    def test_coverage_command_basic(self, tmp_path):
         """Test coverage command with test output file"""
-        runner = CliRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create test output file
-            test_output = """
-            ===== test session starts =====
-            tests/auth/test_oauth.py::test_login PASSED
-            tests/security/test_rbac.py::test_access FAILED
-            ===== 1 failed, 1 passed =====
-            """
-            
-            test_output_file = temp_path / "test_output.txt"
-            with open(test_output_file, 'w') as f:
-                f.write(test_output)
-            
-            # Create specifications directory structure
-            req_dir = temp_path / "requirements"
-            req_dir.mkdir()
-            spec_dir = req_dir / "specifications"
-            spec_dir.mkdir()
-            
-            # Create specification that references the test file
-            spec_data = {
-                "id": "SPEC-COV-001",
-                "title": "Coverage Test Spec",
-                "description": "A specification for coverage testing",
-                "related_requirements": ["REQ-COV-001"],
-                "implementation_unit": "src/oauth.py",
-                "unit_test": "tests/auth/test_oauth.py"
-            }
-            
-            with open(spec_dir / "coverage_spec.yaml", 'w') as f:
-                yaml.dump(spec_data, f)
-            
-            result = runner.invoke(cli, ['coverage', str(test_output_file), 
-                                       '--directory', str(temp_path)],
-                                 catch_exceptions=False)
-            
-            assert result.exit_code == 0
-            # Should show the executed test
-            assert "tests/auth/test_oauth.py" in result.output
+        # Create test output file
+        test_output = """
+        ===== test session starts =====
+        tests/auth/test_oauth.py::test_login PASSED
+        tests/security/test_rbac.py::test_access FAILED
+        ===== 1 failed, 1 passed =====
+        """
+        
+        test_output_file = tmp_path / "test_output.txt"
+        test_output_file.write_text(test_output)
+        
+        # Create specifications directory structure
+        req_dir = tmp_path / "requirements"
+        req_dir.mkdir()
+        spec_dir = req_dir / "specifications"
+        spec_dir.mkdir()
+        
+        # Create specification that references the test file
+        spec_data = {
+            "id": "SPEC-COV-001",
+            "title": "Coverage Test Spec",
+            "description": "A specification for coverage testing",
+            "related_requirements": ["REQ-COV-001"],
+            "implementation_unit": "src/oauth.py",
+            "unit_test": "tests/auth/test_oauth.py"
+        }
+        
+        write_yaml(spec_dir / "coverage_spec.yaml", spec_data)
+        
+        result = _RUNNER.invoke(_CMDS["coverage"], [str(test_output_file), 
+                                   '--directory', str(tmp_path)],
+                             catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        # Should show the executed test
+        assert "tests/auth/test_oauth.py" in result.output
     
-    def test_coverage_command_nonexistent_test_file(self):
+    def test_coverage_command_nonexistent_test_file(self, tmp_path):
         """Test coverage command with specification referencing non-existent test file"""
-        runner = CliRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create empty test output file
-            test_output_file = temp_path / "empty_output.txt"
-            with open(test_output_file, 'w') as f:
-                f.write("No tests found")
-            
-            # Create specifications directory structure
-            req_dir = temp_path / "requirements"
-            req_dir.mkdir()
-            spec_dir = req_dir / "specifications"
-            spec_dir.mkdir()
-            
-            # Create specification with non-existent test file
-            spec_data = {
-                "id": "SPEC-INVALID-001",
-                "title": "Invalid Test Spec",
-                "description": "A specification with invalid test file",
-                "related_requirements": ["REQ-INVALID-001"],
-                "implementation_unit": "src/invalid.py",
-                "unit_test": "tests/nonexistent/test_invalid.py"
-            }
-            
-            with open(spec_dir / "invalid_spec.yaml", 'w') as f:
-                yaml.dump(spec_data, f)
-            
-            result = runner.invoke(cli, ['coverage', str(test_output_file),
-                                       '--directory', str(temp_path)],
-                                 catch_exceptions=False)
-            
-            assert result.exit_code == 0
-            # Should show invalid test files
-            assert "Invalid test files" in result.output or "do not exist" in result.output
+        # Create empty test output file
+        test_output_file = tmp_path / "empty_output.txt"
+        test_output_file.write_text("No tests found")
+        
+        # Create specifications directory structure
+        req_dir = tmp_path / "requirements"
+        req_dir.mkdir()
+        spec_dir = req_dir / "specifications"
+        spec_dir.mkdir()
+        
+        # Create specification with non-existent test file
+        spec_data = {
+            "id": "SPEC-INVALID-001",
+            "title": "Invalid Test Spec",
+            "description": "A specification with invalid test file",
+            "related_requirements": ["REQ-INVALID-001"],
+            "implementation_unit": "src/invalid.py",
+            "unit_test": "tests/nonexistent/test_invalid.py"
+        }
+        
+        write_yaml(spec_dir / "invalid_spec.yaml", spec_data)
+        
+        result = _RUNNER.invoke(_CMDS["coverage"], [str(test_output_file),
+                                   '--directory', str(tmp_path)],
+                             catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        # Should show invalid test files
+        assert "Invalid test files" in result.output or "do not exist" in result.output
 
 
 class TestCreateCommand:
     """Test cases for create command"""
     
-    def test_create_requirement_with_options(self):
+    def test_create_requirement_with_options(self, tmp_path):
         """Test creating a requirement with command line options"""
-        runner = CliRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            output_file = temp_path / "test_requirement.yaml"
-            
-            result = runner.invoke(cli, [
-                'create', 'requirement',
-                '--id', 'TEST-001',
-                '--title', 'Test CLI Requirement',
-                '--req-type', 'functional',
-                '--output', str(output_file)
-            ], input='Test requirement description\n\n',  # Description + empty line to finish criteria
-            catch_exceptions=False)
-            
-            assert result.exit_code == 0
-            assert output_file.exists()
-            
-            # Verify the created file content
-            with open(output_file, 'r') as f:
-                data = yaml.safe_load(f)
-                assert data['id'] == 'REQ-TEST-001'  # Should add REQ- prefix
-                assert data['title'] == 'Test CLI Requirement'
-                assert data['type'] == 'functional'
+        output_file = tmp_path / "test_requirement.yaml"
+        
+        result = _RUNNER.invoke(_CMDS["create"], [
+            'requirement',
+            '--id', 'TEST-001',
+            '--title', 'Test CLI Requirement',
+            '--req-type', 'functional',
+            '--output', str(output_file)
+        ], input='Test requirement description\n\n',  # Description + empty line to finish criteria
+        catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        assert output_file.name in list_files(tmp_path)
+        
+        # Verify the created file content
+        data = yaml.load(output_file.read_text(), Loader=_Loader)
+        assert data['id'] == 'REQ-TEST-001'  # Should add REQ- prefix
+        assert data['title'] == 'Test CLI Requirement'
+        assert data['type'] == 'functional'
+
+    
+    def test_create_requirement_default_output_under_directory(self, tmp_path):
+        """Test that --directory sets where a requirement is written by default"""
+        result = _RUNNER.invoke(_CMDS["create"], [
+            'requirement',
+            '--id', 'DIR-001',
+            '--title', 'Directory Requirement',
+            '--req-type', 'functional',
+            '--directory', str(tmp_path)
+        ], input='Directory requirement description\n\n',
+        catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        assert "req_dir_001.yaml" in list_files(tmp_path / "requirements")
+    
+    def test_create_specification_uses_directory(self, tmp_path):
+        """Test that --directory is used to find requirements and place the specification"""
+        req_dir = tmp_path / "requirements"
+        req_dir.mkdir()
+        write_yaml(req_dir / "dir_req.yaml", {
+            "id": "REQ-DIR-001",
+            "title": "Directory Requirement",
+            "description": "A requirement to link against",
+            "type": "functional",
+            "acceptance_criteria": ["Must be found"]
+        })
+        
+        result = _RUNNER.invoke(_CMDS["create"], [
+            'specification',
+            '--id', 'DIR-001',
+            '--title', 'Directory Specification',
+            '--directory', str(tmp_path)
+        ], input='Directory specification description\n1\nsrc/dir.py\ntests/test_dir.py\n',
+        catch_exceptions=False)
+        
+        assert result.exit_code == 0, result.output
+        spec_file = req_dir / "specifications" / "spec_dir_001.yaml"
+        data = yaml.load(spec_file.read_text(), Loader=_Loader)
+        assert data['related_requirements'] == ['REQ-DIR-001']
 
 
 class TestExportCommand:
     """Test cases for export command"""
     
-    def test_export_command_basic(self):
+    def test_export_command_basic(self, tmp_path):
         """Test basic export command functionality"""
-        runner = CliRunner()
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create basic project structure
-            req_dir = temp_path / "requirements"
-            req_dir.mkdir()
-            spec_dir = req_dir / "specifications"  
-            spec_dir.mkdir()
-            
-            # Create requirement
-            req_data = {
-                "id": "REQ-EXPORT-001",
-                "title": "Export Test Requirement",
-                "description": "A requirement for export testing",
-                "type": "functional"
-            }
-            
-            with open(req_dir / "export_req.yaml", 'w') as f:
-                yaml.dump(req_data, f)
-            
-            # Create specification
-            spec_data = {
-                "id": "SPEC-EXPORT-001",
-                "title": "Export Test Specification",
-                "description": "A specification for export testing",
-                "related_requirements": ["REQ-EXPORT-001"],
-                "implementation_unit": "src/export.py",
-                "unit_test": "tests/test_export.py"
-            }
-            
-            with open(spec_dir / "export_spec.yaml", 'w') as f:
-                yaml.dump(spec_data, f)
-            
-            output_file = temp_path / "test_matrix.xlsx"
-            
-            result = runner.invoke(cli, ['export', '--directory', str(temp_path),
-                                       '--output', str(output_file)],
-                                 catch_exceptions=False)
-            
-            # Note: This test might fail if openpyxl is not available
-            # In that case, we should check for the appropriate error message
-            if result.exit_code != 0 and "openpyxl" in str(result.exception):
-                pytest.skip("openpyxl not available for export testing")
-            else:
-                assert result.exit_code == 0
-                # Excel file creation depends on openpyxl availability
\ No newline at end of file
+        pytest.importorskip("openpyxl")
+        # Create basic project structure
+        req_dir = tmp_path / "requirements"
+        req_dir.mkdir()
+        spec_dir = req_dir / "specifications"  
+        spec_dir.mkdir()
+        
+        # Create requirement
+        req_data = {
+            "id": "REQ-EXPORT-001",
+            "title": "Export Test Requirement",
+            "description": "A requirement for export testing",
+            "type": "functional"
+        }
+        
+        write_yaml(req_dir / "export_req.yaml", req_data)
+        
+        # Create specification
+        spec_data = {
+            "id": "SPEC-EXPORT-001",
+            "title": "Export Test Specification",
+            "description": "A specification for export testing",
+            "related_requirements": ["REQ-EXPORT-001"],
+            "implementation_unit": "src/export.py",
+            "unit_test": "tests/test_export.py"
+        }
+        
+        write_yaml(spec_dir / "export_spec.yaml", spec_data)
+        
+        output_file = tmp_path / "test_matrix.xlsx"
+        
+        result = _RUNNER.invoke(_CMDS["export"], ['--directory', str(tmp_path),
+                                   '--output', str(output_file)],
+                             catch_exceptions=False)
+        
+        assert result.exit_code == 0
+        assert output_file.name in list_files(tmp_path)
\ No newline at end of file
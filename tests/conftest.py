@@ -1,28 +1,124 @@
 """Pytest configuration and shared fixtures for cdlreq tests"""
 
-try:
-    import pytest
-    PYTEST_AVAILABLE = True
-except ImportError:
-    PYTEST_AVAILABLE = False
-    # Create a dummy pytest module
-    class DummyPytest:
-        @staticmethod
-        def fixture(*args, **kwargs):
-            def decorator(func):
-                return func
-            return decorator
-        
-        @staticmethod
-        def skip(reason):
-            print(f"SKIP: {reason}")
-    
-    pytest = DummyPytest()
-
+import copy
+import pytest
+import os
 import tempfile
 import yaml
 from pathlib import Path
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
 from cdlreq.core.models import Requirement, Specification
+from cdlreq.core.parser import ProjectParser
+
+
+def write_yaml(path: Path, data) -> None:
+    """Serialise data to a YAML file in a single write"""
+    path.write_text(yaml.dump(data, Dumper=_Dumper))
+
+
+def list_files(path: Path) -> list:
+    """Return the names of regular files in a directory using one scandir pass"""
+    with os.scandir(path) as it:
+        return [entry.name for entry in it if entry.is_file(follow_symlinks=False)]
+
+
+# Fixed-shape sample files, written verbatim so fixtures skip the YAML emitter
+_REQ_YAML_BYTES = b"""\
+id: REQ-PROJ-001
+title: Project Test Requirement
+description: A requirement for project testing
+type: security
+acceptance_criteria:
+- Must be secure
+- Must be fast
+tags:
+- security
+- performance
+"""
+
+_SPEC_YAML_BYTES = b"""\
+id: SPEC-PROJ-001
+title: Project Test Specification
+description: A specification for project testing
+related_requirements:
+- REQ-PROJ-001
+implementation_unit: src/project_test.py
+unit_test: tests/test_project_test.py
+design_notes: Important design considerations
+"""
+
+
+_TEST_OUTPUT_TEXT = """============================= test session starts ==============================
+platform linux -- Python 3.11.0, pytest-7.4.0, pluggy-1.2.0
+rootdir: /project
+collected 12 items
+
+tests/auth/test_oauth_auth.py::test_oauth_login_valid PASSED                [ 8%]
+tests/auth/test_oauth_auth.py::test_oauth_login_invalid PASSED             [16%]
+tests/auth/test_oauth_auth.py::test_oauth_logout PASSED                    [25%]
+tests/security/test_rbac.py::test_rbac_admin_access PASSED                 [33%]
+tests/security/test_rbac.py::test_rbac_user_access PASSED                  [41%]
+tests/security/test_rbac.py::test_rbac_denied_access FAILED                [50%]
+tests/performance/test_metrics.py::test_response_time PASSED               [58%]
+tests/performance/test_metrics.py::test_throughput PASSED                  [66%]
+tests/data/test_encryption.py::test_encrypt_data PASSED                    [75%]
+tests/data/test_encryption.py::test_decrypt_data PASSED                    [83%]
+tests/audit/test_logging.py::test_audit_log_creation PASSED                [91%]
+tests/audit/test_logging.py::test_audit_log_retrieval FAILED               [100%]
+
+=========================== FAILURES ===========================
+FAILED tests/security/test_rbac.py::test_rbac_denied_access - AssertionError: Access should be denied
+FAILED tests/audit/test_logging.py::test_audit_log_retrieval - KeyError: 'timestamp'
+
+=========================== short test summary info ============================
+FAILED tests/security/test_rbac.py::test_rbac_denied_access - AssertionError
+FAILED tests/audit/test_logging.py::test_audit_log_retrieval - KeyError
+========================= 2 failed, 10 passed in 2.34s ========================="""
+
+
+_MULTI_REQS = [
+    {
+        "id": "REQ-MULTI-001",
+        "title": "First Multi Requirement",
+        "description": "First requirement in multi-test",
+        "type": "functional"
+    },
+    {
+        "id": "REQ-MULTI-002", 
+        "title": "Second Multi Requirement",
+        "description": "Second requirement in multi-test",
+        "type": "security"
+    },
+    {
+        "id": "REQ-MULTI-003",
+        "title": "Third Multi Requirement", 
+        "description": "Third requirement in multi-test",
+        "type": "performance"
+    }
+]
+
+_MULTI_SPECS = [
+    {
+        "id": "SPEC-MULTI-001",
+        "title": "First Multi Specification",
+        "description": "First specification in multi-test",
+        "related_requirements": ["REQ-MULTI-001"],
+        "implementation_unit": "src/multi1.py",
+        "unit_test": "tests/test_multi1.py"
+    },
+    {
+        "id": "SPEC-MULTI-002",
+        "title": "Second Multi Specification",
+        "description": "Second specification in multi-test", 
+        "related_requirements": ["REQ-MULTI-002", "REQ-MULTI-003"],
+        "implementation_unit": "src/multi2.py",
+        "unit_test": "tests/test_multi2.py",
+        "design_notes": "Complex implementation notes"
+    }
+]
 
 
 @pytest.fixture
@@ -45,7 +141,7 @@ def sample_requirement():
     )
 
 
-@pytest.fixture 
+@pytest.fixture
 def sample_specification():
     """Provide a sample specification for testing"""
     return Specification(
@@ -60,45 +156,19 @@ def sample_specification():
 
 
 @pytest.fixture
-def project_structure(temp_dir):
+def project_structure(tmp_path):
     """Create a complete project structure for testing"""
-    # Create directories
-    req_dir = temp_dir / "requirements"
-    req_dir.mkdir()
+    req_dir = tmp_path / "requirements"
     spec_dir = req_dir / "specifications"
-    spec_dir.mkdir()
-    
-    # Create sample requirement
-    req_data = {
-        "id": "REQ-PROJ-001",
-        "title": "Project Test Requirement",
-        "description": "A requirement for project testing",
-        "type": "security",
-        "acceptance_criteria": ["Must be secure", "Must be fast"],
-        "tags": ["security", "performance"]
-    }
+    spec_dir.mkdir(parents=True)
     
     req_file = req_dir / "test_requirement.yaml"
-    with open(req_file, 'w') as f:
-        yaml.dump(req_data, f)
-    
-    # Create sample specification
-    spec_data = {
-        "id": "SPEC-PROJ-001", 
-        "title": "Project Test Specification",
-        "description": "A specification for project testing",
-        "related_requirements": ["REQ-PROJ-001"],
-        "implementation_unit": "src/project_test.py",
-        "unit_test": "tests/test_project_test.py",
-        "design_notes": "Important design considerations"
-    }
-    
+    req_file.write_bytes(_REQ_YAML_BYTES)
     spec_file = spec_dir / "test_specification.yaml"
-    with open(spec_file, 'w') as f:
-        yaml.dump(spec_data, f)
+    spec_file.write_bytes(_SPEC_YAML_BYTES)
     
     return {
-        "base_dir": temp_dir,
+        "base_dir": tmp_path,
         "req_dir": req_dir,
         "spec_dir": spec_dir,
         "req_file": req_file,
@@ -106,38 +176,32 @@ def project_structure(temp_dir):
     }
 
 
-@pytest.fixture
-def test_output_content():
-    """Provide sample test output content for coverage testing"""
-    return """============================= test session starts ==============================
-platform linux -- Python 3.11.0, pytest-7.4.0, pluggy-1.2.0
-rootdir: /project
-collected 12 items
+@pytest.fixture(scope="session")
+def project_parser():
+    """Provide one ProjectParser for the whole session (it holds no per-project state)"""
+    return ProjectParser()
 
-tests/auth/test_oauth_auth.py::test_oauth_login_valid PASSED                [ 8%]
-tests/auth/test_oauth_auth.py::test_oauth_login_invalid PASSED             [16%]
-tests/auth/test_oauth_auth.py::test_oauth_logout PASSED                    [25%]
-tests/security/test_rbac.py::test_rbac_admin_access PASSED                 [33%]
-tests/security/test_rbac.py::test_rbac_user_access PASSED                  [41%]
-tests/security/test_rbac.py::test_rbac_denied_access FAILED                [50%]
-tests/performance/test_metrics.py::test_response_time PASSED               [58%]
-tests/performance/test_metrics.py::test_throughput PASSED                  [66%]
-tests/data/test_encryption.py::test_encrypt_data PASSED                    [75%]
-tests/data/test_encryption.py::test_decrypt_data PASSED                    [83%]
-tests/audit/test_logging.py::test_audit_log_creation PASSED                [91%]
-tests/audit/test_logging.py::test_audit_log_retrieval FAILED               [100%]
 
-=========================== FAILURES ===========================
-FAILED tests/security/test_rbac.py::test_rbac_denied_access - AssertionError: Access should be denied
-FAILED tests/audit/test_logging.py::test_audit_log_retrieval - KeyError: 'timestamp'
+@pytest.fixture(scope="session")
+def parsed_examples(project_parser):
+    """Parse the repository's examples project once per session"""
+    examples_dir = Path(__file__).parent.parent / "examples"
+    if not examples_dir.exists():
+        pytest.skip("Examples directory not found")
+    
+    try:
+        return project_parser.parse_project(examples_dir)
+    except Exception as e:
+        pytest.skip(f"Could not parse examples: {e}")
 
-=========================== short test summary info ============================
-FAILED tests/security/test_rbac.py::test_rbac_denied_access - AssertionError
-FAILED tests/audit/test_logging.py::test_audit_log_retrieval - KeyError
-========================= 2 failed, 10 passed in 2.34s ========================="""
 
+@pytest.fixture(scope="session")
+def test_output_content():
+    """Provide sample test output content for coverage testing"""
+    return _TEST_OUTPUT_TEXT
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def invalid_yaml_content():
     """Provide invalid YAML content for error testing"""
     return """
@@ -149,50 +213,13 @@ def invalid_yaml_content():
     """
 
 
-@pytest.fixture  
+@pytest.fixture
 def multiple_requirements_data():
-    """Provide data for multiple requirements"""
-    return [
-        {
-            "id": "REQ-MULTI-001",
-            "title": "First Multi Requirement",
-            "description": "First requirement in multi-test",
-            "type": "functional"
-        },
-        {
-            "id": "REQ-MULTI-002", 
-            "title": "Second Multi Requirement",
-            "description": "Second requirement in multi-test",
-            "type": "security"
-        },
-        {
-            "id": "REQ-MULTI-003",
-            "title": "Third Multi Requirement", 
-            "description": "Third requirement in multi-test",
-            "type": "performance"
-        }
-    ]
+    """Provide data for multiple requirements (a fresh copy per test)"""
+    return copy.deepcopy(_MULTI_REQS)
 
 
 @pytest.fixture
 def multiple_specifications_data():
-    """Provide data for multiple specifications"""
-    return [
-        {
-            "id": "SPEC-MULTI-001",
-            "title": "First Multi Specification",
-            "description": "First specification in multi-test",
-            "related_requirements": ["REQ-MULTI-001"],
-            "implementation_unit": "src/multi1.py",
-            "unit_test": "tests/test_multi1.py"
-        },
-        {
-            "id": "SPEC-MULTI-002",
-            "title": "Second Multi Specification",
-            "description": "Second specification in multi-test", 
-            "related_requirements": ["REQ-MULTI-002", "REQ-MULTI-003"],
-            "implementation_unit": "src/multi2.py",
-            "unit_test": "tests/test_multi2.py",
-            "design_notes": "Complex implementation notes"
-        }
-    ]
\ No newline at end of file
+    """Provide data for multiple specifications (a fresh copy per test)"""
+    return copy.deepcopy(_MULTI_SPECS)
\ No newline at end of file
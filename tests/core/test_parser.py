@@ -1,20 +1,63 @@
 """Tests for cdlreq.core.parser"""
 
+import pytest
+import yaml
 try:
-    import pytest
+    from yaml import CSafeLoader as _Loader
 except ImportError:
-    # Create a dummy pytest module for environments without pytest
-    class DummyPytest:
-        @staticmethod
-        def skip(reason):
-            print(f"SKIP: {reason}")
-    pytest = DummyPytest()
-
-import tempfile
-import yaml
-from pathlib import Path
+    from yaml import SafeLoader as _Loader
 from cdlreq.core.parser import RequirementParser, SpecificationParser, ProjectParser
 from cdlreq.core.models import Requirement, Specification
+from tests.conftest import write_yaml
+
+# Sample documents shared by several tests; they are only dumped to YAML, never mutated
+_REQ_DATA_FUNC = {
+    "id": "REQ-DIR-001",
+    "title": "Directory req 1",
+    "description": "First requirement",
+    "type": "functional",
+    "acceptance_criteria": ["Must work functionally"]
+}
+
+_REQ_DATA_SEC = {
+    "id": "REQ-DIR-002",
+    "title": "Directory req 2",
+    "description": "Second requirement",
+    "type": "security",
+    "acceptance_criteria": ["Must be secure"]
+}
+
+_SPEC_DATA_DIR = {
+    "id": "SPEC-DIR-001",
+    "title": "Directory spec 1",
+    "description": "First specification",
+    "related_requirements": ["REQ-001"],
+    "implementation_unit": "src/spec1.py",
+    "unit_test": "tests/test_spec1.py"
+}
+
+
+# Fixed-schema documents rendered with str.format, skipping the YAML emitter.
+# Values are inserted unquoted, so they must be plain YAML scalars: no ": ",
+# " #", leading quotes/brackets, or strings YAML reads as other types.
+_REQ_TEMPLATE = """\
+id: {id}
+title: {title}
+description: {description}
+type: {type}
+acceptance_criteria:
+- {crit}
+"""
+
+_SPEC_TEMPLATE = """\
+id: {id}
+title: {title}
+description: {description}
+related_requirements:
+- {req}
+implementation_unit: {implementation_unit}
+unit_test: {unit_test}
+"""
 
 
 class TestRequirementParser:
@@ -39,61 +82,41 @@ class TestRequirementParser:
         assert req.title == "Test requirement"
         assert req.type == "functional"
     
-    def test_parse_requirement_file(self):
+    def test_parse_requirement_file(self, tmp_path):
         """Test parsing requirement from YAML file"""
         parser = RequirementParser()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump({
-                "id": "REQ-FILE-001",
-                "title": "File requirement",
-                "description": "A requirement from file",
-                "type": "security",
-                "acceptance_criteria": ["Must be secure"]
-            }, f)
-            temp_path = f.name
-        
-        try:
-            req = parser.parse_requirement_file(Path(temp_path))
-            assert req.id == "REQ-FILE-001"
-            assert req.type == "security"
-        finally:
-            Path(temp_path).unlink()
+        req_file = tmp_path / "req.yaml"
+        write_yaml(req_file, {
+            "id": "REQ-FILE-001",
+            "title": "File requirement",
+            "description": "A requirement from file",
+            "type": "security",
+            "acceptance_criteria": ["Must be secure"]
+        })
+        
+        req = parser.parse_requirement_file(req_file)
+        assert req.id == "REQ-FILE-001"
+        assert req.type == "security"
+        
+        # The file path must agree with building from the same text in memory
+        text = req_file.read_text()
+        assert req == parser.create_requirement_from_data(yaml.load(text, Loader=_Loader))
     
-    def test_parse_requirements_directory(self):
+    def test_parse_requirements_directory(self, tmp_path):
         """Test parsing multiple requirements from directory"""
         parser = RequirementParser()
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create test requirement files
-            req1_data = {
-                "id": "REQ-DIR-001",
-                "title": "Directory req 1",
-                "description": "First requirement",
-                "type": "functional",
-                "acceptance_criteria": ["Must work functionally"]
-            }
-            req2_data = {
-                "id": "REQ-DIR-002", 
-                "title": "Directory req 2",
-                "description": "Second requirement",
-                "type": "security",
-                "acceptance_criteria": ["Must be secure"]
-            }
-            
-            with open(temp_path / "req1.yaml", 'w') as f:
-                yaml.dump(req1_data, f)
-            with open(temp_path / "req2.yaml", 'w') as f:
-                yaml.dump(req2_data, f)
-            
-            requirements = parser.parse_requirements_directory(temp_path)
-            
-            assert len(requirements) == 2
-            req_ids = [req.id for req in requirements]
-            assert "REQ-DIR-001" in req_ids
-            assert "REQ-DIR-002" in req_ids
+        # Create test requirement files
+        write_yaml(tmp_path / "req1.yaml", _REQ_DATA_FUNC)
+        write_yaml(tmp_path / "req2.yaml", _REQ_DATA_SEC)
+        
+        requirements = parser.parse_requirements_directory(tmp_path)
+        
+        assert len(requirements) == 2
+        req_ids = [req.id for req in requirements]
+        assert "REQ-DIR-001" in req_ids
+        assert "REQ-DIR-002" in req_ids
 
 
 class TestSpecificationParser:
@@ -118,104 +141,113 @@ class TestSpecificationParser:
         assert spec.related_requirements == ["REQ-001"]
         assert spec.implementation_unit == "src/test.py"
     
-    def test_parse_specification_file(self):
+    def test_parse_specification_file(self, tmp_path):
         """Test parsing specification from YAML file"""
         parser = SpecificationParser()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump({
-                "id": "SPEC-FILE-001",
-                "title": "File specification",
-                "description": "A specification from file",
-                "related_requirements": ["REQ-FILE-001"],
-                "implementation_unit": "src/file.py",
-                "unit_test": "tests/test_file.py",
-                "design_notes": "Important notes"
-            }, f)
-            temp_path = f.name
-        
-        try:
-            spec = parser.parse_specification_file(Path(temp_path))
-            assert spec.id == "SPEC-FILE-001"
-            assert spec.design_notes == "Important notes"
-        finally:
-            Path(temp_path).unlink()
+        spec_file = tmp_path / "spec.yaml"
+        write_yaml(spec_file, {
+            "id": "SPEC-FILE-001",
+            "title": "File specification",
+            "description": "A specification from file",
+            "related_requirements": ["REQ-FILE-001"],
+            "implementation_unit": "src/file.py",
+            "unit_test": "tests/test_file.py",
+            "design_notes": "Important notes"
+        })
+        
+        spec = parser.parse_specification_file(spec_file)
+        assert spec.id == "SPEC-FILE-001"
+        assert spec.design_notes == "Important notes"
+        
+        # The file path must agree with building from the same text in memory
+        text = spec_file.read_text()
+        assert spec == parser.create_specification_from_data(yaml.load(text, Loader=_Loader))
     
-    def test_parse_specifications_directory(self):
+    def test_parse_specifications_directory(self, tmp_path):
         """Test parsing multiple specifications from directory"""
         parser = SpecificationParser()
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create specifications subdirectory
-            spec_dir = temp_path / "specifications"
-            spec_dir.mkdir()
-            
-            spec1_data = {
-                "id": "SPEC-DIR-001",
-                "title": "Directory spec 1", 
-                "description": "First specification",
-                "related_requirements": ["REQ-001"],
-                "implementation_unit": "src/spec1.py",
-                "unit_test": "tests/test_spec1.py"
-            }
-            
-            with open(spec_dir / "spec1.yaml", 'w') as f:
-                yaml.dump(spec1_data, f)
-            
-            specifications = parser.parse_specifications_directory(temp_path)
-            
-            assert len(specifications) == 1
-            assert specifications[0].id == "SPEC-DIR-001"
+        # Create specifications subdirectory
+        spec_dir = tmp_path / "specifications"
+        spec_dir.mkdir()
+        
+        write_yaml(spec_dir / "spec1.yaml", _SPEC_DATA_DIR)
+        
+        specifications = parser.parse_specifications_directory(tmp_path)
+        
+        assert len(specifications) == 1
+        assert specifications[0].id == "SPEC-DIR-001"
+
+
+@pytest.fixture(scope="class")
+def sample_project(tmp_path_factory):
+    """Project tree built once per class; tests only read from it"""
+    root = tmp_path_factory.mktemp("sample_project")
+    
+    # Create requirements directory and file
+    req_dir = root / "requirements"
+    req_dir.mkdir()
+    
+    (req_dir / "requirement.yaml").write_text(_REQ_TEMPLATE.format(
+        id="REQ-PROJ-001",
+        title="Project requirement",
+        description="A project requirement",
+        type="functional",
+        crit="Must work in project"
+    ))
+    
+    # Create specifications subdirectory and file
+    spec_dir = req_dir / "specifications"
+    spec_dir.mkdir()
+    
+    (spec_dir / "specification.yaml").write_text(_SPEC_TEMPLATE.format(
+        id="SPEC-PROJ-001",
+        title="Project specification",
+        description="A project specification",
+        req="REQ-PROJ-001",
+        implementation_unit="src/proj.py",
+        unit_test="tests/test_proj.py"
+    ))
+    
+    yield root
 
 
 class TestProjectParser:
     """Test cases for ProjectParser"""
     
-    def test_parse_project(self):
+    def test_parse_project(self, sample_project):
         """Test parsing complete project structure"""
         parser = ProjectParser()
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create requirements directory and file
-            req_dir = temp_path / "requirements"
-            req_dir.mkdir()
-            
-            req_data = {
-                "id": "REQ-PROJ-001",
-                "title": "Project requirement",
-                "description": "A project requirement",
-                "type": "functional",
-                "acceptance_criteria": ["Must work in project"]
-            }
-            
-            with open(req_dir / "requirement.yaml", 'w') as f:
-                yaml.dump(req_data, f)
-            
-            # Create specifications subdirectory and file
-            spec_dir = req_dir / "specifications"
-            spec_dir.mkdir()
-            
-            spec_data = {
-                "id": "SPEC-PROJ-001",
-                "title": "Project specification",
-                "description": "A project specification",
-                "related_requirements": ["REQ-PROJ-001"],
-                "implementation_unit": "src/proj.py",
-                "unit_test": "tests/test_proj.py"
-            }
-            
-            with open(spec_dir / "specification.yaml", 'w') as f:
-                yaml.dump(spec_data, f)
-            
-            result = parser.parse_project(temp_path)
-            
-            assert "requirements" in result
-            assert "specifications" in result
-            assert len(result["requirements"]) == 1
-            assert len(result["specifications"]) == 1
-            assert result["requirements"][0].id == "REQ-PROJ-001"
-            assert result["specifications"][0].id == "SPEC-PROJ-001"
\ No newline at end of file
+        result = parser.parse_project(sample_project)
+        
+        assert "requirements" in result
+        assert "specifications" in result
+        assert len(result["requirements"]) == 1
+        assert len(result["specifications"]) == 1
+        assert result["requirements"][0].id == "REQ-PROJ-001"
+        assert result["specifications"][0].id == "SPEC-PROJ-001"
+    
+    def test_parse_project_matches_directory_parsers(self, tmp_path):
+        """Test that parse_project and the per-type parsers agree on items and order"""
+        parser = ProjectParser()
+        write_yaml(tmp_path / "req1.yaml", _REQ_DATA_FUNC)
+        write_yaml(tmp_path / "req2.yaml", _REQ_DATA_SEC)
+        write_yaml(tmp_path / "spec1.yaml", _SPEC_DATA_DIR)
+        
+        result = parser.parse_project(tmp_path)
+        
+        assert result["requirements"] == parser.req_parser.parse_requirements_directory(tmp_path)
+        assert result["specifications"] == parser.spec_parser.parse_specifications_directory(tmp_path)
+    
+    def test_parse_project_warns_once_per_bad_file(self, tmp_path, capsys):
+        """Test that each file is parsed once, so a broken file is reported once"""
+        parser = ProjectParser()
+        write_yaml(tmp_path / "req1.yaml", _REQ_DATA_FUNC)
+        (tmp_path / "broken.yaml").write_text("id: [unclosed\n")
+        
+        result = parser.parse_project(tmp_path)
+        
+        assert [req.id for req in result["requirements"]] == ["REQ-DIR-001"]
+        assert capsys.readouterr().out.count("Warning: Skipping") == 1
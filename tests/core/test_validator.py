@@ -1,14 +1,6 @@
 """Tests for cdlreq.core.validator"""
 
-try:
-    import pytest
-except ImportError:
-    # Create a dummy pytest module for environments without pytest
-    class DummyPytest:
-        @staticmethod
-        def skip(reason):
-            print(f"SKIP: {reason}")
-    pytest = DummyPytest()
+import pytest
 
 from cdlreq.core.validator import (
     RequirementValidator, 
@@ -63,17 +55,14 @@ class TestRequirementValidator:
         validator = RequirementValidator()
         
         # Test invalid ID (dataclass validation will catch this)
-        try:
-            req = Requirement(
+        with pytest.raises(ValueError, match="REQ-"):
+            Requirement(
                 id="",
                 title="No ID Requirement", 
                 description="A requirement without ID",
                 type="functional",
                 acceptance_criteria=[]
             )
-            assert False, "Should have raised ValueError for invalid ID"
-        except ValueError as e:
-            assert "REQ-" in str(e)
     
     def test_validate_requirement_missing_title(self):
         """Test validating requirement with missing title"""
@@ -102,34 +91,26 @@ class TestRequirementValidator:
     def test_validate_requirement_invalid_type(self):
         """Test validating requirement with invalid type"""
         # Test invalid type (dataclass validation will catch this)
-        try:
-            req = Requirement(
+        with pytest.raises(ValueError, match="Invalid requirement type"):
+            Requirement(
                 id="REQ-003",
                 title="Invalid Type Requirement",
                 description="A requirement with invalid type",
                 type="invalid_type",
                 acceptance_criteria=[]
             )
-            assert False, "Should have raised ValueError for invalid type"
-        except ValueError as e:
-            assert "Invalid requirement type" in str(e)
     
     def test_validate_requirement_multiple_errors(self):
         """Test validating requirement with multiple errors"""
-        # Test multiple validation errors
-        try:
-            # This should fail on ID validation first
-            req = Requirement(
+        # Test multiple validation errors: the ID check fails first
+        with pytest.raises(ValueError, match="REQ-"):
+            Requirement(
                 id="INVALID",  # Wrong prefix
                 title="Multiple errors",
                 description="Multiple errors",
                 type="invalid_type",  # Also invalid
                 acceptance_criteria=[]
             )
-            assert False, "Should have raised ValueError for invalid ID"
-        except ValueError as e:
-            # Should catch the first error (ID)
-            assert "REQ-" in str(e)
 
 
 class TestSpecificationValidator:
@@ -157,8 +138,8 @@ class TestSpecificationValidator:
     def test_validate_specification_missing_id(self):
         """Test validating specification with missing ID"""
         # Test invalid ID (dataclass validation will catch this)
-        try:
-            spec = Specification(
+        with pytest.raises(ValueError, match="SPEC-"):
+            Specification(
                 id="",
                 title="No ID Specification",
                 description="A specification without ID", 
@@ -166,9 +147,6 @@ class TestSpecificationValidator:
                 implementation_unit="src/no_id.py",
                 unit_test="tests/test_no_id.py"
             )
-            assert False, "Should have raised ValueError for invalid ID"
-        except ValueError as e:
-            assert "SPEC-" in str(e)
     
     def test_validate_specification_no_related_requirements(self):
         """Test validating specification without related requirements"""